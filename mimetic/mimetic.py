@@ -1,8 +1,11 @@
+import math
 import threading
 import time
 import traceback
 from typing import Tuple, Literal
 
+# noinspection PyPackageRequirements
+import cv2
 import numpy as np
 
 from mimetic.src.motion_limiter import MotionLimiter
@@ -11,7 +14,14 @@ from src.threads.blossom_sender import BlossomSenderThread
 from mimetic.src.threads.mediapipe_thread import MediaPipeThread
 from src.logging_utils import Logger, print_logger
 from src.threads.frame_capture import FrameCaptureThread
-from src.utils import compact_timestamp
+from src.utils import clamp, compact_timestamp
+
+SMOOTH_KEYS = ("x", "y", "z", "h", "e")  # MotionLimiter channels, fed pitch, roll, yaw, height, height
+PAYLOAD_DECIMALS = 4  # Decimals kept for the values posted to Blossom (well below servo resolution)
+STILL_THUMB_SIZE = (48, 27)  # Thumbnail compared against the last frame sent to MediaPipe
+STILL_MIN_PSNR = 40.0  # Thumbnail and eye-region PSNR (dB) above which a frame counts as unchanged
+STILL_MAX_SKIP_S = 0.1  # Max time since the last frame sent to MediaPipe for a still frame to be skipped;
+                        # with inference latency, keeps pose data within is_pose_fresh's 0.2 s window
 
 
 class Mimetic:
@@ -20,7 +30,7 @@ class Mimetic:
                  multiplier_map: dict[str, float], limit_map: dict[str, dict[str, float]],
                  send_rate: int, send_threshold: float,
                  left_threshold: float = 0.45, right_threshold: float = 0.55, flip_blossoms: bool = False,
-                 mediapipe_delegate: str = "auto"):
+                 mediapipe_delegate: str = "auto", inference_stride: int = 1):
         """
                 Initialize the Mimetic class.
 
@@ -37,6 +47,8 @@ class Mimetic:
                 :param left_threshold: Left-side threshold for MediaPipe detection
                 :param right_threshold: Right-side threshold for MediaPipe detection
                 :param flip_blossoms: Whether to mirror data when sending to Blossom
+                :param mediapipe_delegate: MediaPipe delegate ("auto", "gpu" or "cpu")
+                :param inference_stride: Send only every Nth new camera frame to MediaPipe (1 = every frame)
         """
         self.flip_blossoms = flip_blossoms
         self._stop_event = threading.Event()
@@ -66,6 +78,7 @@ class Mimetic:
         self.left_threshold = left_threshold
         self.right_threshold = right_threshold
         self.mediapipe_delegate = mediapipe_delegate
+        self.inference_stride = max(1, int(inference_stride))
 
 
     def update_sender(self, number: Literal["one", "two"], blossom_sender: BlossomSenderThread | None):
@@ -78,133 +91,196 @@ class Mimetic:
             and sending updates to Blossoms if necessary.
         """
         self.is_running = True
-        last_pose_data = None
+        last_frame_id = 0
+        frame_count = 0
+        last_thumb = None
+        last_eyes = None
+        last_eye_roi = None  # eye region the last_eyes reference was cropped with
+        last_mp_send = 0.0
+        pose_dropped_before = self.pose_logger.dropped
 
-        prev_time = time.time()
+        prev_time = time.perf_counter()
 
         target_fps = 30
         frame_duration = 1.0 / target_fps
         frame_width, frame_height = self.initialize()
 
-        try:
-            while not self._stop_event.is_set():
-                frame_start_time = time.time()
+        # Reduced resolution for MediaPipe, resized into a ring of reused buffers. Frames wait in the
+        # MediaPipe queue and one more is being processed, so the ring is larger than the queue.
+        mp_w, mp_h = min(320, frame_width), min(180, frame_height)
+        mp_bufs = [np.empty((mp_h, mp_w, 3), dtype=np.uint8) for _ in range(self.mp_thread.max_queue + 2)]
+        mp_buf_idx = 0
+        # Fixed-cadence deadline on the monotonic clock, so pacing neither drifts nor follows wall-clock jumps
+        next_deadline = time.monotonic()
+
+        # Bound methods hoisted out of the loop; these objects are fixed once initialize() has run.
+        # The senders and pose logger are not aliased because they can be swapped while running.
+        wait_for_frame = self.capture_thread.wait_for_frame
+        get_frame = self.capture_thread.get_frame
+        mp_thread = self.mp_thread
+        send_mp = mp_thread.send
+        is_pose_fresh = self.pose_buffer.is_pose_fresh
+        get_pose = self.pose_buffer.get_latest_pose_data
+        smooth_many = self.limiter.smooth_and_multiply_many
+        should_send_fn = self.limiter.should_send
+        stopped = self._stop_event.is_set
+        stop_wait = self._stop_event.wait
+        monotonic = time.monotonic
+        perf_counter = time.perf_counter
+        radians = math.radians
 
-                # Reduced resolution for MediaPipe
-                frame_mp = self.capture_thread.get_frame(mirror_video=self.mirror_video, width=min(320, frame_width) ,height=min(180, frame_height))
-                if frame_mp is None:
+        try:
+            while not stopped():
+                # Only feed MediaPipe frames the camera has not delivered before
+                frame_id = wait_for_frame(last_frame_id, timeout=frame_duration)
+                if frame_id == last_frame_id:
                     continue
-                self.mp_thread.send(frame_mp)
+                last_frame_id = frame_id
+
+                # In-between frames reuse the latest pose result, which the limiter keeps smoothing
+                if frame_count % self.inference_stride == 0:
+                    frame_mp = get_frame(mirror_video=self.mirror_video, width=mp_w, height=mp_h,
+                                         out=mp_bufs[mp_buf_idx])
+                    if frame_mp is None:
+                        continue
+                    # Skip inference on frames that match the last one sent; the cached pose stays valid.
+                    # The thumbnail catches head and body motion, the eye crop catches gaze-only changes.
+                    # Both eye crops use the region stored with the reference, as eye_roi jitters per result.
+                    thumb = cv2.resize(frame_mp, STILL_THUMB_SIZE, interpolation=cv2.INTER_NEAREST)
+                    eye_roi = mp_thread.eye_roi
+                    now = monotonic()
+                    still = (last_thumb is not None and now - last_mp_send < STILL_MAX_SKIP_S
+                             and cv2.PSNR(thumb, last_thumb) > STILL_MIN_PSNR)
+                    if still:
+                        if last_eye_roi is not None:
+                            eyes = self._eye_crop(frame_mp, last_eye_roi)
+                            still = eyes is not None and cv2.PSNR(eyes, last_eyes) > STILL_MIN_PSNR
+                        else:
+                            still = eye_roi is None  # a face appeared since the last send: take an eye reference
+                    if not still:
+                        last_thumb = thumb
+                        eyes = self._eye_crop(frame_mp, eye_roi)
+                        last_eyes = eyes.copy() if eyes is not None else None  # the ring slot gets reused
+                        last_eye_roi = eye_roi if eyes is not None else None
+                        last_mp_send = now
+                        mp_buf_idx = (mp_buf_idx + 1) % len(mp_bufs)
+                        send_mp(frame_mp)
+                frame_count += 1
 
                 # Read results from buffer — skip if pose data is stale (detection lost)
-                if not self.pose_buffer.is_pose_fresh():
-                    time.sleep(0.01)
+                if not is_pose_fresh():
+                    stop_wait(0.01)
                     continue
 
-                pose_data, _ = self.pose_buffer.get_latest_pose_data()
+                pose_data, _ = get_pose()
 
                 if pose_data is None:
                     self.logger("[Mimetic] No pose data received yet", level="debug")
-                    time.sleep(0.01)
+                    stop_wait(0.01)
                     continue
 
-                last_pose_data = pose_data
-
-                if last_pose_data is None:
-                    continue  # wait until the first pose is available
-
-                pitch = last_pose_data["pitch"]
-                roll = last_pose_data["roll"]
-                yaw = last_pose_data["yaw"]
-                height = last_pose_data["height"]
+                pitch, roll, yaw, gaze, height, _ = pose_data
 
-                current_time = time.time()
+                current_time = perf_counter()
                 fps = 1.0 / (current_time - prev_time)
                 prev_time = current_time
 
                 if None in (pitch, roll, yaw, height):
                     continue
 
-                pitch -= self.angle_offset["pitch"]
-                roll -= self.angle_offset["roll"]
-                yaw -= self.angle_offset["yaw"]
-
-                pitch = np.clip(pitch, -30, 30)
-                roll = np.clip(roll, -30, 30)
-                yaw = np.clip(yaw, -30, 30)
+                offset = self.angle_offset
+                pitch = clamp(pitch - offset["pitch"], -30, 30)
+                roll = clamp(roll - offset["roll"], -30, 30)
+                yaw = clamp(yaw - offset["yaw"], -30, 30)
 
                 # Smooth pose values
-                x = np.radians(self.limiter.smooth_and_multiply('x', pitch))
-                y = np.radians(self.limiter.smooth_and_multiply('y', roll))
-                z = np.radians(self.limiter.smooth_and_multiply('z', yaw))
-                h = self.limiter.smooth_and_multiply('h', height)
-                e = self.limiter.smooth_and_multiply('e', height)
+                x, y, z, h, e = smooth_many(SMOOTH_KEYS, (pitch, roll, yaw, height, height))
+                x, y, z = radians(x), radians(y), radians(z)
 
                 axis = {'pitch': pitch, 'roll': roll, 'yaw': yaw}
-                should_send, duration = self.limiter.should_send(["x", "y", "z", "h"])
-
-                payload = {
-                    "x": x,
-                    "y": y,
-                    "z": z,
-                    "h": h,
-                    "ears": e,
-                    "ax": 0,
-                    "ay": 0,
-                    "az": -1,
-                    "duration_ms": int(duration * 1000) if duration else 500,
-                    "mirror": self.flip_blossoms,
-                }
+                should_send, duration = should_send_fn(["x", "y", "z", "h"])
+
                 self.data = {
-                    "data_sent": False,
+                    "data_sent": should_send,
                     "axis": axis,
                     "blossom_data": {"x": x, "y": y, "z": z, "h": h, "e": e},
                     "height": height,
-                    "gaze": pose_data["gaze"],
+                    "gaze": gaze,
                     "fps": fps
                 }
-                if should_send:
-                    self.data['data_sent'] = True
 
                 self.pose_logger(self.data)
 
-                # Send data to Blossom if needed
-                if self.is_sending_one and should_send:
-                    try:
-                        if self.blossom_one_sender is not None:
+                # Send data to Blossom if needed; the payload is only built on frames that are actually sent
+                send_one = self.is_sending_one and self.blossom_one_sender is not None
+                send_two = self.is_sending_two and self.blossom_two_sender is not None
+                if should_send and (send_one or send_two):
+                    payload = {
+                        "x": round(x, PAYLOAD_DECIMALS),
+                        "y": round(y, PAYLOAD_DECIMALS),
+                        "z": round(z, PAYLOAD_DECIMALS),
+                        "h": round(h, PAYLOAD_DECIMALS),
+                        "ears": round(e, PAYLOAD_DECIMALS),
+                        "ax": 0,
+                        "ay": 0,
+                        "az": -1,
+                        "duration_ms": int(duration * 1000) if duration else 500,
+                        "mirror": self.flip_blossoms,
+                    }
+                    if send_one:
+                        try:
                             self.blossom_one_sender.send(payload)
-                    except Exception as e:
-                        self.logger(f"[Mimetic] Error sending to Blossom: {e}", level="error")
-                if self.is_sending_two and should_send:
-                    try:
-                        if self.blossom_two_sender is not None:
+                        except Exception as e:
+                            self.logger(f"[Mimetic] Error sending to Blossom: {e}", level="error")
+                    if send_two:
+                        try:
                             self.blossom_two_sender.send(payload)
-                    except Exception as e:
-                        self.logger(f"[Mimetic] Error sending to Blossom: {e}", level="error")
+                        except Exception as e:
+                            self.logger(f"[Mimetic] Error sending to Blossom: {e}", level="error")
 
-                frame_elapsed_time = time.time() - frame_start_time
-                sleep_time = max(0.0, frame_duration - frame_elapsed_time)
+                next_deadline += frame_duration
+                sleep_time = next_deadline - monotonic()
                 if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    stop_wait(sleep_time)  # returns at once when stop() is called
+                else:
+                    next_deadline = monotonic()  # fell behind: resync instead of bursting to catch up
 
         except Exception as e:
             self.logger(f"[Mimetic] Exception in main loop: {e} \n {traceback.format_exc()}", level="critical")
 
         finally:
+            # Pose entries are written by the logger's background thread; make sure the session is on disk
+            self.pose_logger.flush()
+            pose_dropped = self.pose_logger.dropped - pose_dropped_before
+            if pose_dropped:
+                self.logger(f"[Mimetic] Pose log dropped {pose_dropped} entries this run (writer queue full)",
+                            level="warning")
             self.is_running = False
 
+    @staticmethod
+    def _eye_crop(frame: np.ndarray, roi):
+        """Returns the view of frame inside the normalized eye region roi, or None if there is none."""
+        if roi is None:
+            return None
+        h, w = frame.shape[:2]
+        x0, y0 = max(int(roi[0] * w), 0), max(int(roi[1] * h), 0)
+        x1, y1 = min(int(roi[2] * w), w), min(int(roi[3] * h), h)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return frame[y0:y1, x0:x1]
+
     def update_threshold(self, left_threshold, right_threshold):
-        """Update left/right MediaPipe thresholds and restart MediaPipe thread if running."""
+        """Update left/right gaze thresholds, applying them to the running MediaPipe thread in place."""
         self.left_threshold, self.right_threshold = left_threshold, right_threshold
-        if self.is_running:
-            self.mp_thread = MediaPipeThread(result_buffer=self.pose_buffer, logger=self.logger,
-                                         left_threshold=self.left_threshold, right_threshold=self.right_threshold,
-                                         mirror_video=self.mirror_video, delegate=self.mediapipe_delegate)
+        if self.mp_thread is not None:
+            self.mp_thread.update_thresholds(self.left_threshold, self.right_threshold)
 
     def update_output_directory(self, directory):
         """Update output directory and recreate pose logger with new path."""
         self.output_directory = directory
+        old_logger = self.pose_logger
         self.pose_logger = Logger(f"{directory}/{self.study_id}/pose_log.json", mode="pose")
+        old_logger.close()  # write out what the previous logger still has queued
 
     def start_sending(self, blossom_sender: BlossomSenderThread, number: Literal["one", "two"]):
         """Enable sending pose data to a specified Blossom sender."""
@@ -247,7 +323,8 @@ class Mimetic:
         self.logger(f"[INFO] Detected camera with resolution: {frame_width}x{frame_height}")
         self.mp_thread = MediaPipeThread(result_buffer=self.pose_buffer, logger=self.logger,
                                          left_threshold=self.left_threshold, right_threshold=self.right_threshold,
-                                         mirror_video=self.mirror_video, delegate=self.mediapipe_delegate)
+                                         mirror_video=self.mirror_video, delegate=self.mediapipe_delegate,
+                                         probe_frame=frame_display)
         self.mp_thread.start()
         return frame_width, frame_height
 
@@ -261,27 +338,31 @@ class Mimetic:
             return
 
         # --- Angle calibration (pitch, roll, yaw) ---
-        calib_frames = []
+        # Running sums instead of a list of samples; the mean is taken once at the end
+        pitch_sum = roll_sum = yaw_sum = 0.0
+        calib_count = 0
         calib_duration_sec = 2.0
-        start_calib = time.time()
+        start_calib = time.monotonic()
         self.logger("[Mimetic] Calibrating pose... Hold you head neutral and remain still.", level="info")
 
-        while (time.time() - start_calib < calib_duration_sec) and len(calib_frames) < 10:
+        while (time.monotonic() - start_calib < calib_duration_sec) and calib_count < 10:
             frame = self.capture_thread.get_frame(mirror_video=self.mirror_video)
             if frame is None:
                 continue
             self.mp_thread.send(frame)
             pose_data, _ = self.pose_buffer.get_latest_pose_data()
             if pose_data is not None:
-                calib_frames.append((pose_data["pitch"], pose_data["roll"], pose_data["yaw"]))
+                pitch_sum += pose_data.pitch
+                roll_sum += pose_data.roll
+                yaw_sum += pose_data.yaw
+                calib_count += 1
             time.sleep(0.01)
 
-        if calib_frames:
-            pitches, rolls, yaws = zip(*calib_frames)
+        if calib_count:
             self.angle_offset = {
-                "pitch": np.mean(pitches),
-                "roll": np.mean(rolls),
-                "yaw": np.mean(yaws)
+                "pitch": pitch_sum / calib_count,
+                "roll": roll_sum / calib_count,
+                "yaw": yaw_sum / calib_count
             }
             self.logger(
                 f"[Mimetic] Calibration complete:\n"
@@ -1,6 +1,6 @@
 from typing import Tuple
 
-import numpy as np
+from src.utils import clamp
 
 RIGHT_EYE_CORNERS = (33, 133)
 LEFT_EYE_CORNERS  = (362, 263)
@@ -16,9 +16,9 @@ class GazeEstimator:
         self.mirror = mirror
 
     @staticmethod
-    def _iris_center(landmarks, indexes):
-        pts = np.array([(landmarks[i].x, landmarks[i].y) for i in indexes], dtype=np.float32)
-        return pts.mean(axis=0)
+    def _iris_center_x(landmarks, indexes):
+        # Only the horizontal position feeds the gaze ratio; plain floats avoid a small array per eye per frame
+        return sum(landmarks[i].x for i in indexes) / len(indexes)
 
     @staticmethod
     def _eye_ratio(landmarks, outer_idx, inner_idx, cx):
@@ -29,7 +29,7 @@ class GazeEstimator:
         if denom <= 1e-6:
             return 0.5
         r = (cx - left_x) / denom
-        return float(np.clip(r, 0.0, 1.0))
+        return clamp(r, 0.0, 1.0)
 
     def update_from_landmarks(self, landmarks) -> Tuple[str, float]:
 
@@ -37,11 +37,11 @@ class GazeEstimator:
             self.smooth_ratio = self.smooth_ratio if self.smooth_ratio is not None else 0.5
             return "center", self.smooth_ratio
 
-        right_iris_center = self._iris_center(landmarks, RIGHT_IRIS)
-        left_iris_center = self._iris_center(landmarks, LEFT_IRIS)
+        right_iris_x = self._iris_center_x(landmarks, RIGHT_IRIS)
+        left_iris_x = self._iris_center_x(landmarks, LEFT_IRIS)
 
-        right_ratio = self._eye_ratio(landmarks, RIGHT_EYE_CORNERS[0], RIGHT_EYE_CORNERS[1], right_iris_center[0])
-        left_ratio  = self._eye_ratio(landmarks,  LEFT_EYE_CORNERS[0],  LEFT_EYE_CORNERS[1],  left_iris_center[0])
+        right_ratio = self._eye_ratio(landmarks, RIGHT_EYE_CORNERS[0], RIGHT_EYE_CORNERS[1], right_iris_x)
+        left_ratio  = self._eye_ratio(landmarks,  LEFT_EYE_CORNERS[0],  LEFT_EYE_CORNERS[1],  left_iris_x)
         ratio = (right_ratio + left_ratio) * 0.5
 
         self.smooth_ratio = ratio if self.smooth_ratio is None else (self.alpha * ratio + (1 - self.alpha) * self.smooth_ratio)
@@ -1,7 +1,7 @@
 import time
-import numpy as np
 
 from src.logging_utils import Logger
+from src.utils import clamp
 
 class MotionLimiter:
     """
@@ -58,30 +58,26 @@ class MotionLimiter:
         self.last_data = self.smoothed.copy()
         self.values = {}
 
-    def smooth_and_multiply(self, key: str, value: float) -> float | None:
+    def smooth_and_multiply_many(self, keys: tuple | list, values: tuple | list) -> list[float]:
         """
-        Applies exponential smoothing to the value and returns the result.
-        Does not scale or normalize the result.
+        Applies exponential smoothing to several keys in one call, then scales each smoothed value
+        by its multiplier and clips it to its limits. The stored smoothed value is not scaled.
 
         Args:
-            key (str): One of "x", "y", "z", "h", "e"
-            value (float): The input value (in degrees or 0-100 for h/e)
+            keys (tuple | list): Keys to update, e.g. ("x", "y", "z", "h", "e")
+            values (tuple | list): Input values, one per key (none may be None)
 
         Returns:
-            float or None: Smoothed value or None if input is invalid.
+            list: Smoothed, multiplied and clipped values, in the order of keys.
         """
-        if value is None:
-            return None
-        alpha = self.alpha_map.get(key)
-        multiplier = self.multiplier_map.get(key, 1.0)
-        prev = self.smoothed.get(key)
-        min_v = self.limit_map.get("min").get(key)
-        max_v = self.limit_map.get("max").get(key)
-        smoothed = alpha * value + (1 - alpha) * prev
-        multiplied = smoothed * multiplier
-        self.smoothed[key] = smoothed
-        return np.clip(multiplied, min_v, max_v)
-
+        min_map, max_map = self.limit_map.get("min"), self.limit_map.get("max")
+        results = []
+        for key, value in zip(keys, values):
+            alpha = self.alpha_map.get(key)
+            smoothed = alpha * value + (1 - alpha) * self.smoothed.get(key)
+            self.smoothed[key] = smoothed
+            results.append(clamp(smoothed * self.multiplier_map.get(key, 1.0), min_map.get(key), max_map.get(key)))
+        return results
 
     def should_send(self, keys: list) -> tuple[bool, float | None]:
         """
@@ -93,7 +89,7 @@ class MotionLimiter:
         Returns:
             tuple: (should_send (bool), duration (float in seconds or None))
         """
-        now = time.time()
+        now = time.monotonic()
         if now - self.last_sent < self.min_interval:
             return False, None
 
@@ -101,7 +97,7 @@ class MotionLimiter:
         if max_change > self.threshold:
             self.last_sent = now
             self.last_data = {k: self.smoothed[k] for k in keys}
-            duration = np.clip(max_change / 100.0, 0.1, 0.4)
+            duration = clamp(max_change / 100.0, 0.1, 0.4)
             return True, duration
 
         return False, None
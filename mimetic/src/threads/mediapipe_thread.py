@@ -1,7 +1,9 @@
 import os
+import statistics
 import threading
+import time
 import traceback
-from queue import Queue, Empty
+from collections import deque
 
 import cv2
 import mediapipe as mp
@@ -12,11 +14,11 @@ from mediapipe.tasks.python.vision import (
     FaceLandmarkerResult, PoseLandmarkerResult
 )
 
-from mimetic.src.pose_buffer import PoseBuffer
+from mimetic.src.pose_buffer import PoseBuffer, PoseData
 from src.logging_utils import Logger
-from src.utils import resource_path
+from src.utils import clamp, resource_path
 
-from mimetic.src.gaze_utils import GazeEstimator
+from mimetic.src.gaze_utils import GazeEstimator, LEFT_EYE_CORNERS, RIGHT_EYE_CORNERS
 
 FACE_MESH_LANDMARKS = {
     'left_eye': 33,
@@ -37,12 +39,32 @@ POSE_LANDMARKS = {
     'mouth_right': 10
 }
 
+# Landmark indices resolved once, so the per-frame path indexes the landmark lists directly
+NOSE_TIP = FACE_MESH_LANDMARKS['nose_tip']
+FACE_MOUTH_LEFT = FACE_MESH_LANDMARKS['mouth_left']
+FACE_MOUTH_RIGHT = FACE_MESH_LANDMARKS['mouth_right']
+LEFT_SHOULDER = POSE_LANDMARKS['left_shoulder']
+RIGHT_SHOULDER = POSE_LANDMARKS['right_shoulder']
+POSE_TRACKED_LANDMARKS = tuple(POSE_LANDMARKS.values())
+
+POSE_SKIP_MAX_FRAMES = 5  # Max consecutive frames that may reuse the cached pose result
+POSE_STABLE_MAX_DIFF = 4.0  # Max mean absolute pixel difference of the torso ROI to count as stable
+POSE_STABLE_MIN_VISIBILITY = 0.8  # Min visibility of the tracked pose landmarks to allow skipping
+POSE_ROI_MARGIN = 0.1  # Normalized margin added around the tracked pose landmarks
+EYE_ROI_LANDMARKS = RIGHT_EYE_CORNERS + LEFT_EYE_CORNERS  # Face mesh points bounding the eye region
+EYE_ROI_PAD = 0.15  # Padding around the eye corners, as a fraction of the distance between the outer corners
+
+MP_INPUT_MAX_SIDE = 320  # Longest side of the frames handed to the landmarkers
+DELEGATE_PROBE_ITERATIONS = 10  # Timed detections per delegate when the delegate is "auto"
+ERROR_LOG_EVERY = 100  # Log a repeated hot-path error only once every N occurrences
+
 class MediaPipeThread(threading.Thread):
     """
     Thread for processing video frames using MediaPipe for face and pose landmark detection.
 
     This thread uses MediaPipe's FaceLandmarker and PoseLandmarker to detect facial and body landmarks
-    in real-time from video frames. It runs asynchronously and processes frames from a queue.
+    in real-time from video frames. It runs asynchronously and processes frames from a queue, handing
+    each prepared image to one worker thread per landmarker so face and pose dispatch run concurrently.
 
     Args:
         result_buffer (PoseBuffer): Buffer to store processed pose data.
@@ -50,21 +72,33 @@ class MediaPipeThread(threading.Thread):
         max_queue (int, optional): Maximum number of frames in the processing queue.
         logger (Logger, optional): Logger instance for logging messages.
     """
-    def __init__(self, result_buffer: PoseBuffer, logger: Logger, mirror_video: bool, model_dir: str = None, max_queue=8, left_threshold: float = 0.45, right_threshold: float = 0.55, delegate: str = "auto"):
+    def __init__(self, result_buffer: PoseBuffer, logger: Logger, mirror_video: bool, model_dir: str = None, max_queue=1, left_threshold: float = 0.45, right_threshold: float = 0.55, delegate: str = "auto", probe_frame: np.ndarray = None):
         """
         Initialize the MediaPipeThread.
 
         Args:
             result_buffer (PoseBuffer): Buffer to store processed pose data.
             model_dir (str, optional): Directory containing MediaPipe model files.
-            max_queue (int, optional): Maximum number of frames in the processing queue.
+            max_queue (int, optional): Maximum number of frames in the processing queue. Defaults to 1, a
+                latest-wins slot: a frame not yet picked up is replaced by the next one.
             logger (Logger): Logger instance for logging messages.
+            delegate (str, optional): "gpu", "cpu" or "auto" to pick the faster one by measured latency.
+            probe_frame (numpy.ndarray, optional): A captured camera frame to time the delegates on in
+                "auto" mode. Without one a blank frame is used, which only times the detectors.
         """
         super().__init__()
         self.logger = logger
-        self.queue = Queue(maxsize=max_queue)
+        self.max_queue = max_queue
+        self._buf = deque(maxlen=max_queue)
+        self._evt = threading.Event()
+        # Single-slot handoffs from the processing loop to the per-landmarker workers
+        self._face_slot = deque(maxlen=1)
+        self._face_evt = threading.Event()
+        self._pose_slot = deque(maxlen=1)
+        self._pose_evt = threading.Event()
         self.result_buffer = result_buffer
         self.is_running = True
+        self._stop_evt = threading.Event()
         self.latest_face = None
         self.latest_pose = None
         self._landmark_lock = threading.Lock()
@@ -72,6 +106,13 @@ class MediaPipeThread(threading.Thread):
         self.face_valid_until = 0
         self.pose_valid_until = 0
         self.landmark_timeout_ms = 500
+        self._last_processed_ts = -1
+        self._pose_skip_counter = 0
+        self._pose_roi = None
+        self._pose_roi_crop = None
+        self._error_counts = {}
+        self._input_buf = None
+        self.eye_roi = None  # Normalized (x0, y0, x1, y1) eye region of the latest face result, for Mimetic
 
         self.gaze_estimator = GazeEstimator(left_threshold=left_threshold, right_threshold=right_threshold, mirror=mirror_video)
 
@@ -87,23 +128,27 @@ class MediaPipeThread(threading.Thread):
             raise FileNotFoundError(f"MediaPipe models not found in {model_dir}")
 
         try:
-            self._init_landmarkers(face_model, pose_model, delegate=delegate)
+            self._init_landmarkers(face_model, pose_model, delegate=delegate, probe_frame=probe_frame)
         except Exception as e:
             self.logger(f"[MediaPipe] Error initializing MediaPipe models: {e}", level="critical")
             raise RuntimeError("Failed to initialize MediaPipe models") from e
 
     def update_thresholds(self, left_threshold: float, right_threshold: float):
-        self.gaze_estimator = GazeEstimator(left_threshold=left_threshold, right_threshold=right_threshold, mirror=self.gaze_estimator.mirror)
+        # Updated in place so the gaze smoothing state survives a settings change
+        self.gaze_estimator.left_threshold = left_threshold
+        self.gaze_estimator.right_threshold = right_threshold
 
 
-    def _init_landmarkers(self, face_model, pose_model, delegate: str = "auto"):
+    def _init_landmarkers(self, face_model, pose_model, delegate: str = "auto", probe_frame: np.ndarray = None):
         delegate_lower = delegate.lower()
         if delegate_lower == "gpu":
             candidates = [BaseOptions.Delegate.GPU]
         elif delegate_lower == "cpu":
             candidates = [BaseOptions.Delegate.CPU]
         else:  # "auto"
-            candidates = [BaseOptions.Delegate.GPU, BaseOptions.Delegate.CPU]
+            candidates = self._probe_delegates(face_model, pose_model,
+                                               [BaseOptions.Delegate.GPU, BaseOptions.Delegate.CPU],
+                                               probe_frame=probe_frame)
 
         for d in candidates:
             try:
@@ -120,15 +165,93 @@ class MediaPipeThread(threading.Thread):
                     result_callback=self.pose_callback
                 )
                 self.pose_landmarker = vision.PoseLandmarker.create_from_options(pose_options)
-                label = "GPU" if d == BaseOptions.Delegate.GPU else "CPU"
-                self.logger(f"[MediaPipe] Using {label} delegate.", level="info")
+                self.logger(f"[MediaPipe] Using {self._delegate_label(d)} delegate.", level="info")
                 return
             except Exception as e:
-                if d == BaseOptions.Delegate.GPU and delegate_lower == "auto":
-                    self.logger(f"[MediaPipe] GPU initialization failed: {e}. Retrying with CPU...", level="warning")
+                if delegate_lower == "auto" and d is not candidates[-1]:
+                    self.logger(f"[MediaPipe] {self._delegate_label(d)} initialization failed: {e}. "
+                                f"Retrying with next delegate...", level="warning")
                 else:
                     raise
 
+    def _log_exc(self, message: str, e: Exception):
+        """
+        Logs an exception and its traceback in a single logger call.
+
+        Called from the per-frame paths (send, callbacks, try_process), so a repeated error with
+        the same message is only logged once every ERROR_LOG_EVERY occurrences.
+        """
+        count = self._error_counts.get(message, 0) + 1
+        self._error_counts[message] = count
+        if (count - 1) % ERROR_LOG_EVERY:
+            return
+        repeats = f" (x{count})" if count > 1 else ""
+        self.logger(f"{message}: {e}{repeats}\n{traceback.format_exc()}", level="error")
+
+    @staticmethod
+    def _delegate_label(delegate) -> str:
+        return "GPU" if delegate == BaseOptions.Delegate.GPU else "CPU"
+
+    def _probe_delegates(self, face_model, pose_model, candidates: list, probe_frame: np.ndarray = None) -> list:
+        """
+        Benchmarks both landmarkers on each candidate delegate and returns the candidates fastest first.
+
+        The GPU delegate can silently fall back to XNNPACK on CPU, or be slower than the CPU on
+        poor desktop GL drivers, so in "auto" mode the delegate is picked by measured latency
+        instead of assuming GPU is faster. Each candidate runs DELEGATE_PROBE_ITERATIONS synchronous
+        IMAGE-mode detections and the median is compared. Candidates that fail to initialize are
+        left out; if none can be probed the original order is returned.
+
+        The detections run on probe_frame, fitted like live input, so that with a person in view the
+        face mesh and pose landmark models are timed too. Without a probe frame a blank frame is
+        used, on which the detectors find nothing: only the detector models are timed then.
+        """
+        if probe_frame is not None:
+            probe = self._fit_input(probe_frame)
+        else:
+            probe = np.zeros((256, 256, 3), dtype=np.uint8)
+        probe_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=probe)
+        timings = {}
+        for d in candidates:
+            label = self._delegate_label(d)
+            face = pose = None
+            try:
+                face = vision.FaceLandmarker.create_from_options(FaceLandmarkerOptions(
+                    base_options=BaseOptions(model_asset_path=face_model, delegate=d),
+                    running_mode=vision.RunningMode.IMAGE
+                ))
+                pose = vision.PoseLandmarker.create_from_options(PoseLandmarkerOptions(
+                    base_options=BaseOptions(model_asset_path=pose_model, delegate=d),
+                    running_mode=vision.RunningMode.IMAGE
+                ))
+            except Exception as e:
+                self.logger(f"[MediaPipe] {label} delegate unavailable: {e}", level="warning")
+                if face is not None:
+                    face.close()
+                continue
+            try:
+                face.detect(probe_image)  # warm-up, excluded from timing
+                pose.detect(probe_image)
+                samples = []
+                for _ in range(DELEGATE_PROBE_ITERATIONS):
+                    start = time.perf_counter()
+                    face.detect(probe_image)
+                    pose.detect(probe_image)
+                    samples.append(time.perf_counter() - start)
+                timings[d] = statistics.median(samples)
+                self.logger(f"[MediaPipe] {label} delegate median latency: {timings[d] * 1000:.1f} ms", level="info")
+            except Exception as e:
+                self.logger(f"[MediaPipe] {label} delegate probe failed: {e}", level="warning")
+            finally:
+                face.close()
+                pose.close()
+
+        if not timings:
+            return candidates
+        ranked = sorted(timings, key=timings.get)
+        self.logger(f"[MediaPipe] Delegate probe picked {self._delegate_label(ranked[0])}.", level="info")
+        return ranked
+
     def run(self):
         """
         Main thread loop for processing frames from the queue using MediaPipe.
@@ -141,54 +264,161 @@ class MediaPipeThread(threading.Thread):
             self.logger("[MediaPipe] Models not initialized properly, stopping thread", level="error")
             self.is_running = False
             return
+        workers = [
+            threading.Thread(target=self._landmarker_worker, daemon=True,
+                             args=(self.face_landmarker, self._face_slot, self._face_evt)),
+            threading.Thread(target=self._landmarker_worker, daemon=True,
+                             args=(self.pose_landmarker, self._pose_slot, self._pose_evt)),
+        ]
+        for worker in workers:
+            worker.start()
         try:
-            while self.is_running:
+            while not self._stop_evt.is_set():
+                if not self._evt.wait(timeout=0.1):
+                    continue
+                self._evt.clear()
+                try:
+                    item = self._buf.popleft()
+                except IndexError:
+                    continue
+                if self._buf:
+                    self._evt.set()
                 try:
-                    item = self.queue.get(timeout=0.1)
-                    if not self._valid_queue_item(item):
-                        continue
                     frame, timestamp = item
                     self._process_frame(frame, timestamp)
-                except Empty:
-                    continue
                 except Exception as e:
                     self.logger(f"[MediaPipe] Frame processing error: {e}", level="debug")
         except Exception as e:
             self.logger(f"[MediaPipe] CRASHED: {e} \n {traceback.format_exc()}", level="critical")
+        finally:
+            self._stop_evt.set()
+            for worker in workers:
+                worker.join()
+
+    def _landmarker_worker(self, landmarker, slot: deque, evt: threading.Event):
+        """
+        Worker loop that feeds one landmarker with the images handed over by _process_frame.
+
+        Each landmarker has its own worker and single-slot handoff, so the face and pose
+        detect_async dispatches do not wait on each other. Only the latest image is kept,
+        which also keeps the timestamps seen by each landmarker strictly increasing.
+        """
+        while not self._stop_evt.is_set():
+            if not evt.wait(timeout=0.1):
+                continue
+            evt.clear()
+            try:
+                mp_image, timestamp = slot.popleft()
+            except IndexError:
+                continue
+            try:
+                landmarker.detect_async(mp_image, timestamp)
+            except Exception as e:
+                self._log_exc("[MediaPipe] Error dispatching frame", e)
 
     @staticmethod
-    def _valid_queue_item(item):
-        return item is not None and isinstance(item, tuple) and len(item) == 2
+    def _handoff(slot: deque, evt: threading.Event, mp_image: mp.Image, timestamp: int):
+        slot.append((mp_image, timestamp))
+        evt.set()
 
     def _process_frame(self, frame, timestamp):
-        if not isinstance(frame, np.ndarray):
-            self.logger("[MediaPipe] Invalid frame", level="warning")
-            return
+        frame = self._fit_input(frame)
+        # One mp.Image (which copies the pixels once) is shared by both landmarkers
         mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame)
-        self.face_landmarker.detect_async(mp_image, timestamp)
-        self.pose_landmarker.detect_async(mp_image, timestamp)
+        self._handoff(self._face_slot, self._face_evt, mp_image, timestamp)
+        if self._pose_skip_counter < POSE_SKIP_MAX_FRAMES and self._pose_stable(frame):
+            # Torso has not moved: keep the cached pose result valid for this frame
+            self._pose_skip_counter += 1
+            with self._landmark_lock:
+                self.pose_valid_until = timestamp + self.landmark_timeout_ms
+        else:
+            self._handoff(self._pose_slot, self._pose_evt, mp_image, timestamp)
+            self._pose_skip_counter = 0
+            self._update_pose_roi(frame)
+
+    def _fit_input(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Downscales frames larger than MP_INPUT_MAX_SIDE into a reused buffer, keeping the aspect ratio.
+
+        The landmarkers resize to their own small input tensors anyway and return normalized
+        coordinates, so large frames (e.g. full-resolution calibration frames) only add
+        preprocessing cost. Frames already within the limit are returned untouched.
+        """
+        h, w = frame.shape[:2]
+        scale = MP_INPUT_MAX_SIDE / max(h, w)
+        if scale >= 1.0:
+            return frame
+        size = (max(int(w * scale), 1), max(int(h * scale), 1))
+        if self._input_buf is None or self._input_buf.shape != (size[1], size[0], frame.shape[2]):
+            self._input_buf = np.empty((size[1], size[0], frame.shape[2]), dtype=frame.dtype)
+        cv2.resize(frame, size, dst=self._input_buf, interpolation=cv2.INTER_AREA)
+        return self._input_buf
+
+    def _update_pose_roi(self, frame: np.ndarray):
+        """
+        Stores the torso region of the frame sent to the pose landmarker, used later by _pose_stable.
+
+        The region is the bounding box of the tracked pose landmarks of the latest pose result.
+        Nothing is stored if there is no result or its landmarks are not visible enough.
+        """
+        self._pose_roi = None
+        self._pose_roi_crop = None
+        with self._landmark_lock:
+            latest_pose = self.latest_pose
+        if latest_pose is None:
+            return
+        landmarks = latest_pose.pose_landmarks[0]
+        points = [landmarks[i] for i in POSE_TRACKED_LANDMARKS]
+        if min((p.visibility or 0.0) for p in points) < POSE_STABLE_MIN_VISIBILITY:
+            return
+        h, w = frame.shape[:2]
+        x0 = max(int((min(p.x for p in points) - POSE_ROI_MARGIN) * w), 0)
+        x1 = min(int((max(p.x for p in points) + POSE_ROI_MARGIN) * w), w)
+        y0 = max(int((min(p.y for p in points) - POSE_ROI_MARGIN) * h), 0)
+        y1 = min(int((max(p.y for p in points) + POSE_ROI_MARGIN) * h), h)
+        if x1 <= x0 or y1 <= y0:
+            return
+        self._pose_roi = (y0, y1, x0, x1)
+        self._pose_roi_crop = frame[y0:y1, x0:x1].copy()
+
+    def _pose_stable(self, frame: np.ndarray) -> bool:
+        """
+        Returns True if the torso region is unchanged since the last pose inference.
+
+        Compares the same region of the current frame against the crop stored by _update_pose_roi
+        using the mean absolute pixel difference.
+        """
+        if self._pose_roi is None:
+            return False
+        y0, y1, x0, x1 = self._pose_roi
+        crop = frame[y0:y1, x0:x1]
+        if crop.shape != self._pose_roi_crop.shape:
+            return False
+        return float(np.mean(cv2.absdiff(crop, self._pose_roi_crop))) < POSE_STABLE_MAX_DIFF
 
     def send(self, frame: np.ndarray):
         """
         Send a frame to the MediaPipe queue for processing.
 
-        Checks if the queue is full before adding the frame. If the queue is full, logs a debug message.
+        The queue is a bounded deque, so when it is full the oldest pending frame is dropped
+        in favour of the new one. Frames are validated here, once, so the processing loop
+        can trust every queued item.
 
         Args:
-            frame (numpy.ndarray): The video frame to be processed.
+            frame (numpy.ndarray): The video frame to be processed (HxWx3 uint8).
         """
+        if not (isinstance(frame, np.ndarray) and frame.ndim == 3 and frame.dtype == np.uint8):
+            self.logger("[MediaPipe] Invalid frame", level="warning")
+            return
         try:
-            if self.queue.full():
-                self.logger("[MEDIAPIPE] MediaPipe queue full", level="debug")
-                return
             timestamp = int(cv2.getTickCount() / cv2.getTickFrequency() * 1000)
             if timestamp <= self.last_timestamp:
                 timestamp = self.last_timestamp + 1
             self.last_timestamp = timestamp
-            self.queue.put_nowait((frame, timestamp))
+            self._buf.append((frame, timestamp))
+            self._evt.set()
         except Exception as e:
-            self.logger(f"[MediaPipe] Error sending frame: {e}", level="error")
-            traceback.print_exc()
+            self._log_exc("[MediaPipe] Error sending frame", e)
 
     # noinspection PyUnusedLocal
     def face_callback(self, result: FaceLandmarkerResult, output_image: mp.Image , timestamp_ms: int):
@@ -212,8 +442,7 @@ class MediaPipeThread(threading.Thread):
                 self.face_valid_until = timestamp_ms + self.landmark_timeout_ms
             self.try_process(timestamp_ms)
         except Exception as e:
-            self.logger(f"[MediaPipe] Error processing face data: {e}", level="error")
-            traceback.print_exc()
+            self._log_exc("[MediaPipe] Error processing face data", e)
 
     # noinspection PyUnusedLocal
     def pose_callback(self, result: PoseLandmarkerResult, output_image: mp.Image, timestamp_ms: int):
@@ -237,26 +466,34 @@ class MediaPipeThread(threading.Thread):
                 self.pose_valid_until = timestamp_ms + self.landmark_timeout_ms
             self.try_process(timestamp_ms)
         except Exception as e:
-            self.logger(f"[MediaPipe] Error processing pose data: {e}", level="error")
-            traceback.print_exc()
+            self._log_exc("[MediaPipe] Error processing pose data", e)
 
     def try_process(self, timestamp_ms: int):
         """
         Processes the latest face and pose landmarks if available.
 
         Calculates the pose data (pitch, roll, yaw, height) and adds it to the result buffer.
-        Called whenever new face or pose landmarks are detected.
+        Called whenever new face or pose landmarks are detected. Each face result is consumed once
+        and a timestamp is never processed twice, so the second callback of the same frame does
+        not repeat the work. Pose inference can lag face inference by more than a frame (e.g. the
+        full pose model on the CPU delegate), so the face result is paired with the newest pose
+        result rather than waiting for one with a matching timestamp.
 
         Args:
             timestamp_ms (int): The timestamp of the frame in milliseconds.
         """
         with self._landmark_lock:
+            if timestamp_ms == self._last_processed_ts:
+                return
             face_valid = self.latest_face is not None and timestamp_ms <= self.face_valid_until
             pose_valid = self.latest_pose is not None and timestamp_ms <= self.pose_valid_until
             if not face_valid or not pose_valid:
                 return
+            self._last_processed_ts = timestamp_ms
             latest_face = self.latest_face
             latest_pose = self.latest_pose
+            # Drop the face result once consumed; the pose result stays as the cache reused while skipping pose inference
+            self.latest_face = None
         try:
             face_landmarks = latest_face.face_landmarks[0]
             pose_landmarks = latest_pose.pose_landmarks[0]
@@ -268,19 +505,33 @@ class MediaPipeThread(threading.Thread):
             height = self.estimate_height(face_landmarks, pose_landmarks)
 
             gaze_label, gaze_ratio = self.gaze_estimator.update_from_landmarks(landmarks=face_landmarks)
-
-            pose_data = {
-                "pitch": pitch,
-                "roll": roll,
-                "yaw": yaw,
-                "gaze": {'label': gaze_label, 'ratio': gaze_ratio, },
-                "height": height,
-                "timestamp_ms": timestamp_ms,
-            }
+            self.eye_roi = self._eye_roi(face_landmarks)
+
+            pose_data = PoseData(
+                pitch=pitch,
+                roll=roll,
+                yaw=yaw,
+                gaze={'label': gaze_label, 'ratio': gaze_ratio, },
+                height=height,
+                timestamp_ms=timestamp_ms,
+            )
             self.result_buffer.add("pose_data", pose_data, timestamp_ms)
         except Exception as e:
-            self.logger(f"[MediaPipe] Error processing pose data: {e}", level="error")
-            traceback.print_exc()
+            self._log_exc("[MediaPipe] Error processing pose data", e)
+
+    @staticmethod
+    def _eye_roi(face_landmarks):
+        """
+        Returns the normalized (x0, y0, x1, y1) box around both eyes, padded by EYE_ROI_PAD.
+
+        Published for Mimetic's still-frame check: gaze changes only move a few iris pixels, which a
+        whole-frame comparison cannot see, so the eye region is compared on its own.
+        """
+        points = [face_landmarks[i] for i in EYE_ROI_LANDMARKS]
+        x0, x1 = min(p.x for p in points), max(p.x for p in points)
+        y0, y1 = min(p.y for p in points), max(p.y for p in points)
+        pad = (x1 - x0) * EYE_ROI_PAD
+        return x0 - pad, y0 - pad, x1 + pad, y1 + pad
 
     @staticmethod
     def extract_data_from_matrix(data: np.ndarray):
@@ -298,33 +549,18 @@ class MediaPipeThread(threading.Thread):
         Returns:
             int or None: Estimated height as a percentage of a reference height, or None if estimation fails.
         """
-        def get_landmark(key, source='face'):
-            try:
-                if source == 'face':
-                    index = FACE_MESH_LANDMARKS[key]
-                    return face_landmarks[index]
-                elif source == 'pose':
-                    index = POSE_LANDMARKS[key]
-                    return pose_landmarks[index]
-                else:
-                    self.logger(f"[PoseUtils] Unknown landmark source: {source}", level='warning')
-                    return None
-            except (KeyError, IndexError, TypeError) as e:
-                self.logger(f"[PoseUtils] Failed to get landmark {key} from source: {source}: {e}", level='warning')
-                return None
-
         if not face_landmarks or not pose_landmarks:
             self.logger("[PoseUtils] No landmarks available for height estimation", level='debug')
             return None
         try:
-            nose = get_landmark('nose_tip', 'face')
-            mouth_left = get_landmark('mouth_left', 'face')
-            mouth_right = get_landmark('mouth_right', 'face')
+            nose = face_landmarks[NOSE_TIP]
+            mouth_left = face_landmarks[FACE_MOUTH_LEFT]
+            mouth_right = face_landmarks[FACE_MOUTH_RIGHT]
             mouth_y = (mouth_left.y + mouth_right.y) / 2
             head_center_y = (nose.y + mouth_y) / 2
 
-            l_shoulder = get_landmark('left_shoulder', 'pose')
-            r_shoulder = get_landmark('right_shoulder', 'pose')
+            l_shoulder = pose_landmarks[LEFT_SHOULDER]
+            r_shoulder = pose_landmarks[RIGHT_SHOULDER]
 
             shoulder_y = (l_shoulder.y + r_shoulder.y) / 2
             vertical_diff = shoulder_y - head_center_y
@@ -333,11 +569,11 @@ class MediaPipeThread(threading.Thread):
             if shoulder_dx < 0.01:
                 return None
 
-            posture_ratio = np.clip((vertical_diff - 0.15) / (0.25 - 0.15), 0.0, 1.0)
+            posture_ratio = clamp((vertical_diff - 0.15) / (0.25 - 0.15), 0.0, 1.0)
 
             raw_distance = (shoulder_dx - 0.28) / (0.40 - 0.28)
             raw_distance = max(raw_distance, 0.0)
-            distance_ratio = np.clip(raw_distance ** 0.5, 0.0, 1.0)
+            distance_ratio = clamp(raw_distance ** 0.5, 0.0, 1.0)
 
             combined = 0.8 * posture_ratio + 0.2 * distance_ratio
             return int(combined * 100)
@@ -349,20 +585,24 @@ class MediaPipeThread(threading.Thread):
         """
         Stops the MediaPipe thread and releases resources.
 
-        Sets the running flag to False, closes the face and pose landmarker instances,
-        and allows the thread to exit gracefully.
+        Sets the stop event, waits for the processing loop to exit and then closes the face
+        and pose landmarker instances, so no frame is dispatched to a closed landmarker.
         """
         self.logger("[MediaPipe] Stopping thread", level="info")
         if not self.is_running:
             self.logger("[MediaPipe] Thread already stopped", level="warning")
             return
         self.is_running = False
+        self._stop_evt.set()
+        self._evt.set()  # wake run() if it is waiting for a frame
+        self._face_evt.set()
+        self._pose_evt.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout=1.0)
         try:
             self.face_landmarker.close()
             self.pose_landmarker.close()
         except Exception as e:
             self.logger(f"[MediaPipe] Error closing MediaPipe models: {e}", level="error")
-        self.queue.put(None)
-        with self.queue.mutex:
-            self.queue.queue.clear()
+        self._buf.clear()
         self.logger("[MediaPipe] Thread stopped", level="info")
\ No newline at end of file
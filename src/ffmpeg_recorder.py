@@ -68,7 +68,8 @@ class FFmpegRecorder:
             self.logger("[FFmpegRecorder] Cannot write frame: ffmpeg not running", level="error")
             return False
         try:
-            self.process.stdin.write(frame.tobytes())
+            # Write the frame's own buffer instead of a tobytes() copy; only non-contiguous views get copied
+            self.process.stdin.write(np.ascontiguousarray(frame).data)
             return True
         except Exception as e:
             self.logger(f"[FFmpegRecorder] Failed to write frame: {e}", level="error")
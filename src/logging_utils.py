@@ -1,9 +1,16 @@
+import atexit
 import json
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
+from queue import Queue, Empty, Full
 from typing import Literal, Optional
 
+LOG_QUEUE_MAX = 1024  # Entries buffered for the writer thread; when full, pose entries are dropped and system entries wait
+LOG_BATCH_MAX = 64  # Max entries serialized and appended to the file in one write
+
+_CLOSE = object()  # Sentinel that stops the writer thread
+
 
 def print_logger(message, level, *args, **kwargs):
     colors = {
@@ -24,6 +31,7 @@ class Logger:
         self.log_level = (level or "info").lower()
         self.output_path = Path(output_path)
         self.print_to_terminal = print_to_terminal
+        self.mode = mode
 
         if mode == "pose":
             self.log = self._log_pose
@@ -34,17 +42,97 @@ class Logger:
         if not self.output_path.exists():
             self.output_path.touch()
         self._lock = threading.Lock()
+        self.dropped = 0  # pose entries discarded because the writer queue was full, or any entry logged after close()
+        self._closed = False
+        self._file = None  # append handle owned by the writer thread
+        self._file_path = None
+
+        # Serialization and file I/O run on a writer thread, so callers on hot paths only enqueue
+        self._queue = Queue(maxsize=LOG_QUEUE_MAX)
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+        atexit.register(self.close)  # the writer is a daemon; drain its queue before the interpreter exits
 
     # ---------- append helpers ----------
 
     def _append_entry(self, entry: dict):
-        line = json.dumps(entry, ensure_ascii=False) + "\n"
-        with self._lock:
-            try:
-                with open(self.output_path, "a", encoding="utf-8") as f:
-                    f.write(line)  # sem flush/fsync para performance
-            except Exception as e:
-                print(f"[Logger] Failed to write to log file: {e}")
+        if self._closed:
+            with self._lock:
+                self.dropped += 1
+            return
+        if self.mode == "system":
+            # System and error messages are never dropped; a full queue only makes the caller wait for the writer
+            self._queue.put(entry)
+            return
+        try:
+            self._queue.put_nowait(entry)
+        except Full:
+            with self._lock:
+                self.dropped += 1
+
+    def _writer_loop(self):
+        """Drains the queue in batches of up to LOG_BATCH_MAX entries, one file append per batch."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < LOG_BATCH_MAX and batch[-1] is not _CLOSE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            lines = []
+            for entry in batch:
+                if entry is _CLOSE:
+                    continue
+                try:
+                    lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+                except Exception as e:
+                    print(f"[Logger] Failed to serialize log entry: {e}")
+            if lines:
+                try:
+                    f = self._log_file()
+                    f.write("".join(lines))
+                    f.flush()  # one flush per batch keeps the file current for readers; no fsync
+                except Exception as e:
+                    print(f"[Logger] Failed to write to log file: {e}")
+            if batch[-1] is _CLOSE and self._file is not None:
+                self._file.close()
+                self._file = None
+            for _ in batch:
+                self._queue.task_done()
+            if batch[-1] is _CLOSE:
+                return
+
+    def _log_file(self):
+        """Returns the persistent append handle, reopening it if output_path has been changed."""
+        path = str(self.output_path)
+        if self._file is None or self._file_path != path:
+            if self._file is not None:
+                self._file.close()
+            self._file = open(path, "a", encoding="utf-8")
+            self._file_path = path
+        return self._file
+
+    def set_output_path(self, output_path: str):
+        """Points the logger at a new file. Entries logged before the call are written to the old one."""
+        self.flush()
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch(exist_ok=True)
+        self.output_path = path  # the writer thread closes the old handle and reopens on its next batch
+
+    def flush(self):
+        """Blocks until every entry queued so far has been written to the file."""
+        if self._writer.is_alive():
+            self._queue.join()
+
+    def close(self):
+        """Writes the remaining entries, closes the file and stops the writer thread. Later entries are dropped."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(_CLOSE)
+        self._writer.join()
 
     def _log_system(self, message: str, level: str = "info"):
         levels = {"debug": 0, "info": 1, "warning": 2, "error": 3, "critical": 4}
@@ -23,7 +23,7 @@ from src.threads.calibrate_thread import CalibrateThread
 from src.threads.frame_capture import FrameCaptureThread
 from src.threads.mimetic_thread import MimeticRunnerThread
 from src.threads.recorder_thread import RecorderThread
-from src.utils import compact_timestamp, get_local_ip
+from src.utils import compact_timestamp, get_local_ip, parse_resolution
 
 LOG_LEVEL = "info"
 
@@ -66,7 +66,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.limit_map = self.settings.limit_map
         self.send_rate = self.settings.send_rate
         self.send_threshold = self.settings.send_threshold
+        self.inference_stride = self.settings.inference_stride
         self.cam_device = self.settings.cam_device
+        self.cam_resolution = self.settings.cam_resolution
 
         #Dancer
         self.dancer_mode = self.settings.dancer_mode
@@ -76,7 +78,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         self.logger = Logger(f"{self.output_directory}/{self.study_id}/system_log.json", mode="system")
 
-        self.capture_thread = FrameCaptureThread(logger=self.logger, device=self.cam_device)
+        self.capture_thread = FrameCaptureThread(logger=self.logger, device=self.cam_device,
+                                                 resolution=parse_resolution(self.cam_resolution))
         self.capture_thread.start()
 
         self.log_timer = QTimer()
@@ -100,6 +103,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         self.mimetic_thread = None
         self.calib_thread = None
+        self._display_frame = None
+        self._display_scaled = None  # label-sized preview buffer, reused while the label size is unchanged
 
         self.timer.timeout.connect(self.update_video_frame)  # type: ignore
         self.timer.start(30)
@@ -136,6 +141,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             send_rate=self.send_rate,
             send_threshold=self.send_threshold,
             flip_blossoms=self.flip_blossoms,
+            inference_stride=self.inference_stride,
         )
 
 
@@ -202,6 +208,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         changed_limit_map = old.limit_map != new.limit_map
         changed_send_rate = old.send_rate != new.send_rate
         changed_send_threshold = old.send_threshold != new.send_threshold
+        changed_inference_stride = old.inference_stride != new.inference_stride
         changed_mirror_video = old.mirror_video != new.mirror_video
         changed_flip_blossoms = old.flip_blossoms != new.flip_blossoms
         changed_host = (old.host != new.host)
@@ -211,6 +218,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         changed_blossom_two_endpoint = changed_host or changed_blossom_two_port
         changed_music_directory = (old.music_directory != new.music_directory)
         changed_cam_device = (old.cam_device != new.cam_device)
+        changed_cam_resolution = (old.cam_resolution != new.cam_resolution)
 
         if changed_thresholds:
             try:
@@ -228,6 +236,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.logger("[Main] Updated for new mimetic motion limiter values.", level="info")
 
 
+        if changed_inference_stride:
+            self.inference_stride = new.inference_stride
+            self.mimetic.inference_stride = new.inference_stride
+            self.logger(f"[Main] Updated inference stride: every {self.inference_stride} frame(s)", level="info")
+
         if changed_music_directory:
             self.dancer.music_directory = new.music_directory
 
@@ -236,8 +249,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.terminal_output.clear()
             self._log_pos = 0
             self._last_log_msgs = [0, "", ""]
-            self.logger = Logger(output_path=f"{self.output_directory}/{self.study_id}/system_log.json", mode="system", level=LOG_LEVEL)
-            self.capture_thread.logger = self.logger
+            # Retarget the shared logger instead of replacing it: Mimetic, Dancer and the capture thread hold it
+            self.logger.set_output_path(f"{self.output_directory}/{self.study_id}/system_log.json")
 
         if changed_host:
             self.host = new.host
@@ -280,20 +293,23 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.mirror_video = new.mirror_video
             self.logger(f"[Main] Changed to new mirror_video setting: {new.mirror_video}", level="info")
 
-        if changed_cam_device:
+        if changed_cam_device or changed_cam_resolution:
             self.capture_thread.stop()
             self.capture_thread.join()
             self.cam_device = new.cam_device
-            self.capture_thread = FrameCaptureThread(logger=self.logger, device=self.cam_device)
+            self.cam_resolution = new.cam_resolution
+            self.capture_thread = FrameCaptureThread(logger=self.logger, device=self.cam_device,
+                                                     resolution=parse_resolution(self.cam_resolution))
             self.capture_thread.start()
-            self.mimetic.frame_capture_thread = self.capture_thread
+            self.mimetic.capture_thread = self.capture_thread
             if not self.capture_thread.cap.isOpened():
                 self.logger(f"[Main] Cam {self.cam_device} is offline", level="warning")
                 self.cam_feed.setText("Cam Off")
 
         if (changed_blossom_one_endpoint or changed_blossom_two_endpoint or changed_output_directory or changed_flip_blossoms or
             changed_mirror_video or changed_thresholds or changed_alpha_map or changed_send_threshold or changed_send_rate or
-            changed_study_id or changed_music_directory or changed_multiplier_map or changed_limit_map or changed_cam_device):
+            changed_study_id or changed_music_directory or changed_multiplier_map or changed_limit_map or changed_cam_device or
+            changed_inference_stride or changed_cam_resolution):
             self.logger("[Main] Settings applied.", level="info")
         else:
             self.logger("[Main] No changes to be applied.", level="info")
@@ -301,21 +317,40 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
 
     def update_video_frame(self):
-        frame = self.capture_thread.get_frame(mirror_video=self.mirror_video)
+        # Nothing is shown while the window is minimized or the preview hidden, so skip the copy and scaling
+        if self.isMinimized() or not self.cam_feed.isVisible():
+            return
+        # Reuse the previous display frame as the destination buffer (reallocated by get_frame on resolution change)
+        frame = self.capture_thread.get_frame(mirror_video=self.mirror_video, out=self._display_frame)
         if frame is None:
             return
+        self._display_frame = frame
+
+        # Shrink to the label size in OpenCV first, so Qt converts and scales only the pixels that are shown
+        target = self.cam_feed.size()
+        h, w = frame.shape[:2]
+        scale = min(target.width() / w, target.height() / h)
+        if 0 < scale < 1:
+            size = (max(int(w * scale), 1), max(int(h * scale), 1))
+            scaled = self._display_scaled
+            if scaled is None or scaled.shape[:2] != (size[1], size[0]):
+                scaled = self._display_scaled = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+            else:
+                cv2.resize(frame, size, dst=scaled, interpolation=cv2.INTER_AREA)
+            frame = scaled
 
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb.shape
+        # Qt reads BGR directly, so no per-frame RGB copy is needed; fromImage copies before the buffer is reused
+        h, w, ch = frame.shape
         bytes_per_line = ch * w
-        qt_img = QImage(rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+        qt_img = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_BGR888)
         pixmap = QPixmap.fromImage(qt_img)
-        scaled_pixmap = pixmap.scaled(
-            self.cam_feed.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.cam_feed.setPixmap(scaled_pixmap)
+        if scale >= 1:
+            pixmap = pixmap.scaled(
+                target,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+        self.cam_feed.setPixmap(pixmap)
 
     def closeEvent(self, event):
         self.timer.stop()
@@ -339,6 +374,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         if self.recorder_thread and self.recorder_thread.is_running:
             self.recorder_thread.stop()
             self.recorder_thread.join()
+        self.logger.close()  # the writer thread is a daemon, so write out queued entries and close the file before exiting
         event.accept()
 
     def calibrate_pose(self):
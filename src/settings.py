@@ -30,7 +30,9 @@ class Settings:
     send_rate: int = 5
     send_threshold: float = 2.0
     target_fps: int = 30
+    inference_stride: int = 1
     cam_device: str = "/dev/video0"
+    cam_resolution: str = "auto"
     mediapipe_delegate: str = "auto"
 
     # Dancer
@@ -74,8 +76,10 @@ class SettingManager:
         settings.send_rate = int(self.qs.value("send_rate", settings.send_rate))
         settings.send_threshold = float(self.qs.value("send_threshold", settings.send_threshold))
         settings.target_fps = int(self.qs.value("target_fps", settings.target_fps))
+        settings.inference_stride = int(self.qs.value("inference_stride", settings.inference_stride))
 
         settings.cam_device = self.qs.value("cam_device", settings.cam_device)
+        settings.cam_resolution = self.qs.value("cam_resolution", settings.cam_resolution)
         settings.mediapipe_delegate = self.qs.value("mediapipe_delegate", settings.mediapipe_delegate)
 
         # Dancer
@@ -109,7 +113,9 @@ class SettingManager:
         self.qs.setValue("send_threshold", settings.send_threshold)
         self.qs.setValue("send_rate", settings.send_rate)
         self.qs.setValue("target_fps", settings.target_fps)
+        self.qs.setValue("inference_stride", settings.inference_stride)
         self.qs.setValue("cam_device", settings.cam_device)
+        self.qs.setValue("cam_resolution", settings.cam_resolution)
         self.qs.setValue("mediapipe_delegate", settings.mediapipe_delegate)
 
         # Dancer
@@ -65,6 +65,8 @@ class SettingsDialog(QDialog, Ui_SettingsDialog):
         self.multiplier_map_e_value.setValue(current.multiplier_map['e'])
         self.send_rate.setValue(current.send_rate)
         self.send_threshold.setValue(current.send_threshold)
+        self.inference_stride.setValue(current.inference_stride)
+        self.cam_resolution.setCurrentText(current.cam_resolution)
         self.mediapipe_delegate.setCurrentText(current.mediapipe_delegate)
 
         # Dancer
@@ -122,7 +124,9 @@ class SettingsDialog(QDialog, Ui_SettingsDialog):
                 send_rate=int(self.send_rate.text()),
                 send_threshold=float(self.send_threshold.text()),
                 target_fps=int(self.target_fps.text()),
+                inference_stride=self.inference_stride.value(),
                 cam_device=self.cam_device.currentText(),
+                cam_resolution=self.cam_resolution.currentText(),
                 mediapipe_delegate=self.mediapipe_delegate.currentText(),
                 # Dancer
                 music_directory=self.music_directory.text().strip(),
@@ -282,6 +282,15 @@ class Ui_SettingsDialog(object):
         self.target_fps.setMaximum(60)
         self.target_fps.setProperty("value", 30)
         self.target_fps.setObjectName("target_fps")
+        self.inference_stride_group = QtWidgets.QGroupBox(parent=self.mimetic_tab)
+        self.inference_stride_group.setGeometry(QtCore.QRect(480, 270, 120, 80))
+        self.inference_stride_group.setObjectName("inference_stride_group")
+        self.inference_stride = QtWidgets.QSpinBox(parent=self.inference_stride_group)
+        self.inference_stride.setGeometry(QtCore.QRect(20, 40, 44, 28))
+        self.inference_stride.setMinimum(1)
+        self.inference_stride.setMaximum(3)
+        self.inference_stride.setProperty("value", 1)
+        self.inference_stride.setObjectName("inference_stride")
         self.motion_multipliers_group = QtWidgets.QGroupBox(parent=self.mimetic_tab)
         self.motion_multipliers_group.setGeometry(QtCore.QRect(140, 10, 121, 221))
         self.motion_multipliers_group.setObjectName("motion_multipliers_group")
@@ -471,8 +480,15 @@ class Ui_SettingsDialog(object):
         self.cam_device_group.setGeometry(QtCore.QRect(10, 240, 461, 80))
         self.cam_device_group.setObjectName("cam_device_group")
         self.cam_device = QtWidgets.QComboBox(parent=self.cam_device_group)
-        self.cam_device.setGeometry(QtCore.QRect(10, 40, 441, 27))
+        self.cam_device.setGeometry(QtCore.QRect(10, 40, 321, 27))
         self.cam_device.setObjectName("cam_device")
+        self.cam_resolution = QtWidgets.QComboBox(parent=self.cam_device_group)
+        self.cam_resolution.setGeometry(QtCore.QRect(340, 40, 111, 27))
+        self.cam_resolution.setObjectName("cam_resolution")
+        self.cam_resolution.addItem("")
+        self.cam_resolution.addItem("")
+        self.cam_resolution.addItem("")
+        self.cam_resolution.addItem("")
         self.mediapipe_delegate_group = QtWidgets.QGroupBox(parent=self.mimetic_tab)
         self.mediapipe_delegate_group.setGeometry(QtCore.QRect(10, 330, 461, 60))
         self.mediapipe_delegate_group.setObjectName("mediapipe_delegate_group")
@@ -577,6 +593,8 @@ class Ui_SettingsDialog(object):
         self.hz_2.setText(_translate("SettingsDialog", "º"))
         self.target_fps_group.setTitle(_translate("SettingsDialog", "Target FPS"))
         self.FPS.setText(_translate("SettingsDialog", "FPS"))
+        self.inference_stride_group.setTitle(_translate("SettingsDialog", "Inference Stride"))
+        self.inference_stride.setToolTip(_translate("SettingsDialog", "Run pose inference on every Nth camera frame"))
         self.motion_multipliers_group.setTitle(_translate("SettingsDialog", "Multipliers"))
         self.x_2.setText(_translate("SettingsDialog", "x"))
         self.y_2.setText(_translate("SettingsDialog", "y"))
@@ -592,6 +610,11 @@ class Ui_SettingsDialog(object):
         self.min.setText(_translate("SettingsDialog", "Min"))
         self.max.setText(_translate("SettingsDialog", "Max"))
         self.cam_device_group.setTitle(_translate("SettingsDialog", "Camera Device"))
+        self.cam_resolution.setToolTip(_translate("SettingsDialog", "Capture resolution requested from the camera"))
+        self.cam_resolution.setItemText(0, _translate("SettingsDialog", "auto"))
+        self.cam_resolution.setItemText(1, _translate("SettingsDialog", "1280x720"))
+        self.cam_resolution.setItemText(2, _translate("SettingsDialog", "640x480"))
+        self.cam_resolution.setItemText(3, _translate("SettingsDialog", "640x360"))
         self.mediapipe_delegate_group.setTitle(_translate("SettingsDialog", "MediaPipe Delegate"))
         self.mediapipe_delegate.setItemText(0, _translate("SettingsDialog", "auto"))
         self.mediapipe_delegate.setItemText(1, _translate("SettingsDialog", "gpu"))
@@ -1,13 +1,20 @@
+import json
 import threading
 import time
 import traceback
+from collections import deque
 from queue import Queue, Empty, Full
 from typing import Literal
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.logging_utils import Logger
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+SENT_LOG_INTERVAL = 1.0  # Seconds between "Sent ->" debug lines in mimetic mode
+MIMETIC_POST_TIMEOUT = 0.25  # Seconds; a stale pose is worth less than the next one
+
 
 class BlossomSenderThread(threading.Thread):
     def __init__(self, logger: Logger, mode: Literal["mimetic", "dancer"], host="localhost", port: int = 8000, max_queue: int = 32, min_interval: float = 0.1):
@@ -22,50 +29,65 @@ class BlossomSenderThread(threading.Thread):
         self.mode = mode
         self.is_running = True
         self.last_send_time = 0.0
+        self._last_sent_log_time = 0.0
+        # Mimetic mode keeps only the newest pose: send() overwrites it, the worker takes it
+        self._pending = deque(maxlen=1)
+        self._pending_event = threading.Event()
+        # One pooled keep-alive connection to the Blossom server instead of a new TCP connection per request
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
 
     def run(self):
         self.logger(f"[BlossomSender] Thread started (mode: {self.mode})", level="info")
         try:
             while self.is_running:
-                try:
-                    self.last_payload = payload = self.queue.get(timeout=0.1)
-                except Empty:
-                    if self.mode == "mimetic":
-                        self._cooperative_sleep(0.01)
+                if self.mode == "mimetic":
+                    payload = self._take_pending()
+                    if payload is None:
                         continue
-                if self.last_payload is None:
-                    if self.mode == "mimetic":
-                        self.logger("[BlossomSender] Payload is empty", level="warning")
-                        break
-                    else:
+                    self.last_payload = payload
+                else:
+                    try:
+                        self.last_payload = self.queue.get(timeout=0.1)
+                    except Empty:
+                        pass
+                    if self.last_payload is None:
                         continue
 
                 # rate limit
-                now = time.time()
+                now = time.monotonic()
                 dt = now - self.last_send_time
                 if dt < self.min_interval:
                     self._cooperative_sleep(self.min_interval - dt)
+                    if self.mode == "mimetic" and self._pending:
+                        # A newer pose arrived while rate limiting; send that one instead
+                        self.last_payload = payload = self._pending.popleft()
 
                 try:
                     if self.mode == "mimetic":
-                        requests.post(f"http://{self.host}:{self.port}/position", json=payload, timeout=1)
-                        self.last_send_time = time.time()
-                        x = payload.get("x", 0)
-                        y = payload.get("y", 0)
-                        z = payload.get("z", 0)
-                        h = payload.get("h", 0)
-                        duration = payload.get("duration_ms", 0) / 1000
-                        self.logger(
-                            f"[BlossomSender] Sent -> Pitch: {x:.3f}, Roll: {y:.3f}, Yaw: {z:.3f}, Height: {h:.3f}, Duration: {duration:.2f}s", level="debug")
+                        # Compact separators and a prebuilt header dict keep per-send encoding minimal
+                        body = json.dumps(payload, separators=(",", ":"))
+                        self.session.post(f"http://{self.host}:{self.port}/position", data=body,
+                                          headers=JSON_HEADERS, timeout=MIMETIC_POST_TIMEOUT)
+                        self.last_send_time = time.monotonic()
+                        if self.last_send_time - self._last_sent_log_time >= SENT_LOG_INTERVAL:
+                            self._last_sent_log_time = self.last_send_time
+                            x = payload.get("x", 0)
+                            y = payload.get("y", 0)
+                            z = payload.get("z", 0)
+                            h = payload.get("h", 0)
+                            duration = payload.get("duration_ms", 0) / 1000
+                            self.logger(
+                                f"[BlossomSender] Sent -> Pitch: {x:.3f}, Roll: {y:.3f}, Yaw: {z:.3f}, Height: {h:.3f}, Duration: {duration:.2f}s", level="debug")
                     else:
                         sequence = self.last_payload.get("sequence")
                         duration_ms = self.last_payload.get("duration_ms")
                         if not sequence or duration_ms <= 0:
                             self.logger("[BlossomSender] Invalid sequence payload", level="warning")
                             continue
-                        requests.get(f"http://{self.host}:{self.port}/s/{sequence}", timeout=2)
+                        self.session.get(f"http://{self.host}:{self.port}/s/{sequence}", timeout=2)
                         self.logger(f"[BlossomSender] Sent sequence: '{sequence}'", level="debug")
-                        self.last_send_time = time.time()
+                        self.last_send_time = time.monotonic()
                         self._cooperative_sleep(duration_ms / 1000.0)
 
 
@@ -76,20 +98,38 @@ class BlossomSenderThread(threading.Thread):
             self.logger(f"[BlossomSender] CRASHED: {e} \n {traceback.format_exc()}", level="critical")
         finally:
             self.logger("[BlossomSender] Closing thread", level="info")
+            self.session.close()
             self.stop()
 
     def _cooperative_sleep(self, seconds: float, step: float = 0.02):
-        end = time.time() + max(0.0, seconds)
-        while self.is_running and time.time() < end:
-            time.sleep(max(step, end - time.time()))
+        end = time.monotonic() + max(0.0, seconds)
+        while self.is_running and time.monotonic() < end:
+            time.sleep(max(step, end - time.monotonic()))
         # self.logger(f"[BlossomSender] slept for {seconds} seconds", level="debug")
 
+    def _take_pending(self, timeout: float = 0.1):
+        """
+        Wait for and take the newest pending mimetic payload.
+
+        Args:
+            timeout (float): Maximum time to wait, in seconds.
+
+        Returns:
+            dict | None: The payload, or None if nothing arrived or the thread is stopping.
+        """
+        if not self._pending_event.wait(timeout):
+            return None
+        self._pending_event.clear()
+        try:
+            return self._pending.popleft()
+        except IndexError:
+            return None
+
     def send(self, payload: dict):
         if self.mode == "mimetic":
-            if not self.queue.full():
-                self.queue.put_nowait(payload)
-            else:
-                self.logger("[BlossomSender] Queue full, dropping pose", level="warning")
+            # Never blocks the caller; an unsent older pose is simply replaced
+            self._pending.append(payload)
+            self._pending_event.set()
         else:
             if not self.queue.full():
                 self.logger(f"[BlossomSender] received payload containing sequence: {payload['sequence']}", level="debug")
@@ -104,6 +144,8 @@ class BlossomSenderThread(threading.Thread):
         Signals the thread to stop, unblocks the queue, and clears any remaining payloads.
         """
         self.is_running = False
+        self._pending.clear()
+        self._pending_event.set()  # unblock _take_pending()
         try:
             self.queue.put_nowait(None)  # unblock queue.get()
         except Full:
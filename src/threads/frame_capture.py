@@ -2,6 +2,7 @@ import threading
 import traceback
 # noinspection PyPackageRequirements
 import cv2
+import numpy as np
 
 from src.logging_utils import Logger
 
@@ -14,14 +15,18 @@ class FrameCaptureThread(threading.Thread):
     Args:
         cam_index (int, optional): Index of the camera to capture from. Defaults to 0.
         logger (Logger, optional): Logger instance for logging messages.
+        resolution (tuple[int, int], optional): Preferred capture resolution (width, height).
     """
-    def __init__(self, logger:Logger, device:str):
+    def __init__(self, logger:Logger, device:str, resolution: tuple[int, int] | None = None):
         """
         Initializes the FrameCaptureThread with a camera index and a logger.
 
         Args:
             cam_index (int, optional): Index of the camera to capture from. Defaults to 0.
             logger (Logger): Logger instance for logging messages.
+            resolution (tuple[int, int], optional): Preferred capture resolution (width, height), tried before
+                the built-in list. Lets setups that do not need the HD preview or recording capture close to the
+                MediaPipe input size, so the camera scales instead of get_frame. Defaults to the largest supported.
         """
         super().__init__()
 
@@ -31,23 +36,33 @@ class FrameCaptureThread(threading.Thread):
             (800, 600),
             (640, 480)
         ]
+        if resolution is not None:
+            resolution = (int(resolution[0]), int(resolution[1]))  # normalized so lists compare equal below
+            resolutions.insert(0, resolution)
 
         self.logger = logger
         self.cap = cv2.VideoCapture(device)
         if not self.cap.isOpened():
             self.logger("[CaptureThread] Camera failed to open.", level="error")
             self.logger(f"[CaptureThread] Failed to open camera: {device}", level="error")
+        # Ask for MJPG so the webcam delivers compressed frames instead of raw YUYV over USB (ignored if unsupported)
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        # Keep only the newest frame in the driver queue so reads never return stale frames
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         for width, height in resolutions:
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
             actual_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
             actual_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
             if actual_width == width and actual_height == height:
-                self.logger(f"[INFO] Using max supported resolution: {width}x{height}", level="info")
+                self.logger(f"[INFO] Using {'requested' if (width, height) == resolution else 'max supported'} "
+                            f"resolution: {width}x{height}", level="info")
                 break
         self.is_running = True
         self.latest_frame = None
+        self.frame_id = 0  # incremented for every captured frame
         self.lock = threading.Lock()
+        self.frame_ready = threading.Condition(self.lock)
 
     def run(self):
         """
@@ -60,15 +75,17 @@ class FrameCaptureThread(threading.Thread):
             while self.is_running and self.cap.isOpened():
                 ret, frame = self.cap.read()
                 if ret:
-                    with self.lock:
+                    with self.frame_ready:
                         self.latest_frame = frame
+                        self.frame_id += 1
+                        self.frame_ready.notify_all()
         except Exception as e:
             self.logger(f"[FrameCaptureThread] CRASHED: {e}", level="critical")
             traceback.print_exc()
         finally:
             self.cap.release()
 
-    def get_frame(self, width: int=None, height: int=None, mirror_video: bool=False):
+    def get_frame(self, width: int=None, height: int=None, mirror_video: bool=False, out: np.ndarray=None):
         """
         Retrieves the latest captured frame, optionally resizing and/or mirroring it.
 
@@ -76,6 +93,9 @@ class FrameCaptureThread(threading.Thread):
             width (int, optional): Desired width of the frame.
             height (int, optional): Desired height of the frame.
             mirror_video (bool, optional): Whether to mirror the frame horizontally. Defaults to False.
+            out (numpy.ndarray, optional): Preallocated buffer to write the frame into. Used when its shape
+                matches the requested size (or the captured frame if no resize is requested), so the frame is
+                resized, flipped or copied straight into it instead of allocating a new array.
 
         Returns:
             numpy.ndarray or None: The latest frame, processed as specified, or None if unavailable.
@@ -83,13 +103,44 @@ class FrameCaptureThread(threading.Thread):
         with self.lock:
             if self.latest_frame is None:
                 return None
-            frame = self.latest_frame.copy()
+            if out is not None:
+                if width and height:
+                    if out.shape == (height, width, self.latest_frame.shape[2]):
+                        cv2.resize(self.latest_frame, (width, height), dst=out)
+                        if mirror_video:
+                            cv2.flip(out, 1, dst=out)
+                        return out
+                elif out.shape == self.latest_frame.shape:
+                    if mirror_video:
+                        cv2.flip(self.latest_frame, 1, dst=out)
+                    else:
+                        np.copyto(out, self.latest_frame)
+                    return out
+            # resize and flip already return new arrays, so the latest frame is only copied when returned as-is
+            frame = self.latest_frame
             if width and height:
                 frame = cv2.resize(frame, (width, height))
             if mirror_video:
-               frame = cv2.flip(frame, 1)
+                frame = cv2.flip(frame, 1)
+            if frame is self.latest_frame:
+                frame = frame.copy()
             return frame
 
+    def wait_for_frame(self, last_id: int, timeout: float=None) -> int:
+        """
+        Blocks until a frame newer than last_id has been captured, or until the timeout expires.
+
+        Args:
+            last_id (int): Frame id the caller has already consumed.
+            timeout (float, optional): Maximum time to wait in seconds. Waits indefinitely if None.
+
+        Returns:
+            int: The id of the latest captured frame (equal to last_id if the wait timed out).
+        """
+        with self.frame_ready:
+            self.frame_ready.wait_for(lambda: self.frame_id != last_id, timeout=timeout)
+            return self.frame_id
+
     def stop(self):
         """
         Stops the frame capture thread. Camera release is handled by the run() finally block.
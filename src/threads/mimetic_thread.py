@@ -11,10 +11,14 @@ class MimeticRunnerThread(QThread):
         self.is_running = True
 
     def run(self):
+        last_data = None
         while self.is_running:
             try:
-                data = self.mimetic.data if self.mimetic.data is not None else {}
-                self.data_updated.emit(data)  # type: ignore
+                # Mimetic publishes a new dict per processed frame: only emit when it changed
+                data = self.mimetic.data
+                if data is not last_data:
+                    last_data = data
+                    self.data_updated.emit(data if data is not None else {})  # type: ignore
             except Exception:
                 pass
             self.msleep(30)
@@ -1,6 +1,10 @@
 import threading
 import time
 import traceback
+from collections import deque
+
+import numpy as np
+
 from src.ffmpeg_recorder import FFmpegRecorder
 from src.logging_utils import Logger
 from src.threads.frame_capture import FrameCaptureThread
@@ -20,6 +24,17 @@ class RecorderThread(threading.Thread):
         self.recorder = FFmpegRecorder(output_path=output_path, fps=self.fps, resolution=self.resolution, logger=self.logger)
         self.ready = threading.Event()
 
+        # Capture -> encoder handoff of (buffer, frame, count): count is how many output frames the
+        # frame fills. If ffmpeg falls behind the oldest frame is dropped and its count moves to the newest
+        self._encode_q = deque(maxlen=2)
+        # Reusable frame buffers: one being filled, one being written and the queued ones
+        width, height = self.resolution
+        self._free_bufs = deque(np.empty((height, width, 3), dtype=np.uint8) for _ in range(self._encode_q.maxlen + 2))
+        self._encode_evt = threading.Event()
+        self._capture_done = threading.Event()
+        self._writer = None
+        self.repeated_frames = 0  # output frames filled by repeating a frame, to stay in real time
+
     def run(self):
         if not self.capture_thread.is_running:
             self.logger("[Recorder] Capture thread is not running. Exiting.", level="error")
@@ -30,6 +45,8 @@ class RecorderThread(threading.Thread):
             self.is_running = True
             self.logger("[Recorder] Started", level="info")
             self.ready.set()
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
 
         except Exception as e:
             self.logger(f"[Recorder] CRASHED: {e}\n{traceback.format_exc()}", level="critical")
@@ -38,35 +55,93 @@ class RecorderThread(threading.Thread):
 
         self.logger(f"[Recorder] Recording started at {self.fps} FPS with resolution {self.resolution[0]}x{self.resolution[1]}", level="info")
 
+        # ffmpeg is fed a constant-rate stream (-r fps), so the video stays in real time (and aligned with
+        # the pose log) only if exactly one frame is written per elapsed interval. Intervals missed during
+        # a stall or an empty frame are filled by repeating the next captured frame.
         interval = 1.0 / self.fps
-        next_frame_time = time.time() + interval
-        first_written = False
+        start_time = time.monotonic()
+        frames_due = 0
 
         try:
             while self.is_running:
-                frame = self.capture_thread.get_frame(mirror_video=self.mirror)
+                try:
+                    buf = self._free_bufs.popleft()
+                except IndexError:
+                    buf = None  # all buffers in use, let get_frame allocate
+                frame = self.capture_thread.get_frame(mirror_video=self.mirror, out=buf)
                 if frame is not None and frame.size > 0:
-                    success = self.recorder.write_frame(frame)
-                    if success and not first_written:
-                        self.logger("[Recorder] First frame written.", level="debug")
-                        first_written = True
+                    elapsed = int((time.monotonic() - start_time) / interval) + 1
+                    count = max(1, elapsed - frames_due)
+                    frames_due += count
+                    self._enqueue(buf, frame, count)
                 else:
+                    self._release(buf)
                     self.logger("[Recorder] Skipped empty frame", level="warning")
                     time.sleep(0.1)
                     continue
 
-                time.sleep(max(0.0, next_frame_time - time.time()))
-                next_frame_time += interval
+                time.sleep(max(0.0, start_time + frames_due * interval - time.monotonic()))
 
         except Exception as e:
             self.logger(f"[Recorder] CRASHED: {e}\n{traceback.format_exc()}", level="critical")
 
         finally:
+            self._capture_done.set()
+            self._encode_evt.set()
+            if self._writer is not None:
+                self._writer.join()
             self.recorder.stop_recording()
+            if self.repeated_frames:
+                self.logger(f"[Recorder] Repeated {self.repeated_frames} frames to keep the video in real time",
+                            level="warning")
             self.stop()
             self.logger("[Recorder] Thread stopped", level="info")
             self.logger(f"[Recorder] Recordings saved to {self.recorder.output_path}", level="info")
 
+    def _enqueue(self, buf, frame, count: int = 1):
+        if len(self._encode_q) == self._encode_q.maxlen:
+            try:
+                dropped_buf, _, dropped_count = self._encode_q.popleft()
+                self._release(dropped_buf)
+                count += dropped_count  # the newer frame fills the dropped frame's time
+            except IndexError:
+                pass  # the writer took it meanwhile
+        self._encode_q.append((buf, frame, count))
+        self._encode_evt.set()
+
+    def _release(self, buf):
+        if buf is not None:
+            self._free_bufs.append(buf)
+
+    def _writer_loop(self):
+        """
+        Writes queued frames to ffmpeg on a separate thread, so a slow encoder or disk
+        does not delay the capture loop. Each frame is written as many times as its count.
+        Drains the queue before exiting once capture is done.
+        """
+        first_written = False
+        while True:
+            self._encode_evt.wait(timeout=0.1)
+            self._encode_evt.clear()
+            done = self._capture_done.is_set()
+            while self._encode_q:
+                try:
+                    buf, frame, count = self._encode_q.popleft()
+                except IndexError:
+                    break
+                success = False
+                for _ in range(count):
+                    success = self.recorder.write_frame(frame)
+                    if not success:
+                        break
+                self.repeated_frames += count - 1
+                self._release(buf)
+                if success and not first_written:
+                    self.logger("[Recorder] First frame written.", level="debug")
+                    first_written = True
+            if done:
+                break
+
     def stop(self):
         self.logger("[Recorder] Stop called", level="debug")
         if self.is_running:
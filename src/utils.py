@@ -1,7 +1,7 @@
 import os
 from datetime import datetime
 import socket
-from typing import Optional
+from typing import Optional, Tuple
 
 
 def resource_path(relative_path: str) -> str:
@@ -25,6 +25,27 @@ def compact_timestamp() -> str:
     now = datetime.now()
     return now.strftime("%Y%m%d-%H%M%S") + f"{int(now.microsecond / 1000):03d}"
 
+def clamp(value: float, low: float, high: float) -> float:
+    """
+    Limits a scalar to [low, high].
+
+    Plain comparisons instead of np.clip, which builds and unboxes a 0-d array for every scalar.
+    """
+    return low if value < low else high if value > high else value
+
+def parse_resolution(text: str) -> Optional[Tuple[int, int]]:
+    """
+    Parses a "WIDTHxHEIGHT" string such as "640x360".
+
+    Returns:
+        tuple[int, int] | None: (width, height), or None for "auto" or a malformed value.
+    """
+    try:
+        width, height = (int(v) for v in str(text).lower().split("x"))
+    except ValueError:
+        return None
+    return (width, height) if width > 0 and height > 0 else None
+
 def get_local_ip() -> Optional[str]:
     s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     try: